@@ -35,6 +35,10 @@ setup(
         "logging": [
             "structlog>=23.0.0",
         ],
+        "perf": [
+            "orjson>=3.9.0",
+            'uvloop>=0.18.0; sys_platform != "win32"',
+        ],
     },
     entry_points={
         "console_scripts": [
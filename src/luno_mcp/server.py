@@ -223,8 +223,7 @@ async def run_server(
 
     try:
         # Setup tools
-        if hasattr(mcp, "_setup_tools"):
-            await mcp._setup_tools()
+        await mcp._setup_tools()
 
         logger.info(f"Starting Luno MCP server on {server_config.transport.value}")
         if server_config.transport.value in ["streamable-http", "sse"]:
@@ -269,8 +268,7 @@ def get_server() -> FastMCP:
 
         # Setup tools synchronously for compatibility
         async def setup():
-            if hasattr(mcp, "_setup_tools"):
-                await mcp._setup_tools()
+            await mcp._setup_tools()
 
         # Try to setup tools if event loop is available
         try:
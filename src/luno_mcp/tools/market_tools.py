@@ -434,19 +434,22 @@ def register_market_tools(mcp: FastMCP, client: LunoClient) -> None:
             }
 
 
+# Candle durations (seconds) supported by Luno, mapped to their short names
+_DURATION_NAMES = {
+    60: "1m",
+    300: "5m",
+    900: "15m",
+    1800: "30m",
+    3600: "1h",
+    10800: "3h",
+    14400: "4h",
+    28800: "8h",
+    86400: "24h",
+    259200: "3d",
+    604800: "7d",
+}
+
+
 def _get_duration_name(duration: int) -> str:
     """Convert duration in seconds to human-readable name."""
-    duration_map = {
-        60: "1m",
-        300: "5m",
-        900: "15m",
-        1800: "30m",
-        3600: "1h",
-        10800: "3h",
-        14400: "4h",
-        28800: "8h",
-        86400: "24h",
-        259200: "3d",
-        604800: "7d",
-    }
-    return duration_map.get(duration, f"{duration}s")
+    return _DURATION_NAMES.get(duration, f"{duration}s")
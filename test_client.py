@@ -13,6 +13,21 @@ import logging
 import argparse
 from typing import Dict, Any, Optional
 from fastmcp import Client
+from fastmcp.client.transports import StdioTransport
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    _json_loads = json.loads
+
+try:
+    import uvloop
+
+    _run = uvloop.run
+except ImportError:  # uvloop is optional; fall back to the default event loop
+    _run = asyncio.run
 
 logging.basicConfig(
     level=logging.INFO,
@@ -25,6 +40,12 @@ logger = logging.getLogger(__name__)
 class FastMCPTestClient:
     """Test client for FastMCP Luno server."""
 
+    # Launch the STDIO server with the interpreter running this client
+    SERVER_COMMAND = sys.executable
+    SERVER_ARGS = ["-m", "src.main", "--transport", "stdio"]
+    # Run from the project root so "src.main" resolves wherever the client is started
+    SERVER_CWD = os.path.dirname(os.path.abspath(__file__))
+
     def __init__(self, transport="stdio", host="localhost", port=8000):
         self.transport = transport
         self.host = host
@@ -36,12 +57,22 @@ class FastMCPTestClient:
         if self.transport == "stdio":
             logger.info("Creating STDIO client for FastMCP server")
             # For STDIO, we need to run the server as a subprocess
-            self.client = Client("python -m src.main --transport stdio")
+            # Forward our environment so LUNO_API_KEY etc. reach the server
+            self.client = Client(
+                StdioTransport(
+                    command=self.SERVER_COMMAND,
+                    args=self.SERVER_ARGS,
+                    env=dict(os.environ),
+                    cwd=self.SERVER_CWD,
+                )
+            )
         elif self.transport == "streamable-http":
-            logger.info(f"Creating Streamable HTTP client for {self.host}:{self.port}")
+            logger.info(
+                "Creating Streamable HTTP client for %s:%s", self.host, self.port
+            )
             self.client = Client(f"http://{self.host}:{self.port}")
         elif self.transport == "sse":
-            logger.info(f"Creating SSE client for {self.host}:{self.port}")
+            logger.info("Creating SSE client for %s:%s", self.host, self.port)
             self.client = Client(f"http://{self.host}:{self.port}/sse")
         else:
             raise ValueError(f"Unsupported transport: {self.transport}")
@@ -65,6 +96,13 @@ class FastMCPTestClient:
         """Call a tool."""
         return await self.client.call_tool(name, arguments)
 
+    async def _call_json(self, name: str, arguments: Dict[str, Any]):
+        """Call a tool and parse its JSON reply once; None if the reply is empty."""
+        result = await self.call_tool(name, arguments)
+        if not result:
+            return None
+        return _json_loads(result[0].text)
+
     async def test_server_info(self):
         """Test server basic information."""
         logger.info("Testing server tools...")
@@ -82,13 +120,10 @@ class FastMCPTestClient:
 
     async def test_crypto_price(self, pair="XBTZAR"):
         """Test cryptocurrency price retrieval."""
-        logger.info(f"Testing crypto price for {pair}...")
+        logger.info("Testing crypto price for %s...", pair)
         try:
-            result = await self.call_tool("get_crypto_price", {"pair": pair})
-            if result and len(result) > 0:
-                response_text = result[0].text
-                response = json.loads(response_text)
-
+            response = await self._call_json("get_crypto_price", {"pair": pair})
+            if response is not None:
                 if "error" in response:
                     print(
                         f"\n⚠️  Price test returned error for {pair}: {response['error']}"
@@ -109,11 +144,8 @@ class FastMCPTestClient:
         """Test market overview."""
         logger.info("Testing market overview...")
         try:
-            result = await self.call_tool("get_market_overview", {})
-            if result and len(result) > 0:
-                response_text = result[0].text
-                response = json.loads(response_text)
-
+            response = await self._call_json("get_market_overview", {})
+            if response is not None:
                 if "error" in response:
                     print(
                         f"\n⚠️  Market overview test returned error: {response['error']}"
@@ -139,11 +171,8 @@ class FastMCPTestClient:
         """Test account balance (requires auth)."""
         logger.info("Testing account balance...")
         try:
-            result = await self.call_tool("get_account_balance", {})
-            if result and len(result) > 0:
-                response_text = result[0].text
-                response = json.loads(response_text)
-
+            response = await self._call_json("get_account_balance", {})
+            if response is not None:
                 if "error" in response:
                     if (
                         "authentication" in response["error"].lower()
@@ -172,13 +201,10 @@ class FastMCPTestClient:
 
     async def test_fees(self, pair="XBTZAR"):
         """Test fees information."""
-        logger.info(f"Testing fees for {pair}...")
+        logger.info("Testing fees for %s...", pair)
         try:
-            result = await self.call_tool("get_fees", {"pair": pair})
-            if result and len(result) > 0:
-                response_text = result[0].text
-                response = json.loads(response_text)
-
+            response = await self._call_json("get_fees", {"pair": pair})
+            if response is not None:
                 if "error" in response:
                     if (
                         "authentication" in response["error"].lower()
@@ -204,22 +230,23 @@ class FastMCPTestClient:
         """Run basic functionality tests."""
         print("=== Running FastMCP Server Tests ===")
 
-        test_results = []
-
-        # Test 1: Server info and tools
-        test_results.append(await self.test_server_info())
-
-        # Test 2: Crypto price (public endpoint)
-        test_results.append(await self.test_crypto_price())
-
-        # Test 3: Market overview (public endpoint)
-        test_results.append(await self.test_market_overview())
-
-        # Test 4: Account balance (private endpoint - may fail without auth)
-        test_results.append(await self.test_account_balance())
-
-        # Test 5: Fees (private endpoint - may fail without auth)
-        test_results.append(await self.test_fees())
+        # The tests probe independent endpoints, so run them concurrently.
+        # Each test prints its report without awaiting in between, so the
+        # output of different tests does not interleave.
+        results = await asyncio.gather(
+            # Test 1: Server info and tools
+            self.test_server_info(),
+            # Test 2: Crypto price (public endpoint)
+            self.test_crypto_price(),
+            # Test 3: Market overview (public endpoint)
+            self.test_market_overview(),
+            # Test 4: Account balance (private endpoint - may fail without auth)
+            self.test_account_balance(),
+            # Test 5: Fees (private endpoint - may fail without auth)
+            self.test_fees(),
+            return_exceptions=True,
+        )
+        test_results = [result is True for result in results]
 
         # Summary
         passed = sum(test_results)
@@ -239,81 +266,121 @@ class FastMCPTestClient:
 
         return passed == total
 
+    async def _poll_round(self, pairs, pair_arguments):
+        """Fetch and print the current price of every pair once."""
+        # Pairs are independent, so query them all at once
+        responses = await asyncio.gather(
+            *[
+                self._call_json("get_crypto_price", arguments)
+                for arguments in pair_arguments
+            ],
+            return_exceptions=True,
+        )
+
+        for pair, response in zip(pairs, responses):
+            if isinstance(response, Exception):
+                print(f"{pair}: Exception - {response}")
+            elif response is not None:
+                if "error" not in response:
+                    print(
+                        f"{pair}: Ask={response.get('ask')}, Bid={response.get('bid')}"
+                    )
+                else:
+                    print(f"{pair}: Error - {response['error']}")
+
+    async def _poll_forever(self, pairs, interval=5):
+        """Poll prices every interval seconds, measured from round start."""
+        loop = asyncio.get_running_loop()
+        # Every round sends the same arguments, so build them once up front
+        pair_arguments = [{"pair": pair} for pair in pairs]
+
+        while True:
+            round_start = loop.time()
+            await self._poll_round(pairs, pair_arguments)
+            await asyncio.sleep(max(0, interval - (loop.time() - round_start)))
+
     async def monitor_prices(self, pairs=["XBTZAR", "ETHZAR"], duration=30):
         """Monitor cryptocurrency prices."""
         print(f"=== Monitoring Prices for {duration} seconds ===")
 
-        start_time = asyncio.get_event_loop().time()
+        # wait_for rather than asyncio.timeout() keeps Python 3.10 support
+        try:
+            await asyncio.wait_for(self._poll_forever(pairs), timeout=duration)
+        except asyncio.TimeoutError:
+            pass
 
-        while (asyncio.get_event_loop().time() - start_time) < duration:
-            for pair in pairs:
-                try:
-                    result = await self.call_tool("get_crypto_price", {"pair": pair})
-                    if result and len(result) > 0:
-                        response_text = result[0].text
-                        response = json.loads(response_text)
 
-                        if "error" not in response:
-                            print(
-                                f"{pair}: Ask={response.get('ask')}, Bid={response.get('bid')}"
-                            )
-                        else:
-                            print(f"{pair}: Error - {response['error']}")
-                except Exception as e:
-                    print(f"{pair}: Exception - {e}")
+# Default command line options, shared by argparse and the no-argument fast path
+DEFAULT_ARGS = {
+    "transport": "stdio",
+    "host": "localhost",
+    "port": 8000,
+    "mode": "test",
+    "pairs": "XBTZAR,ETHZAR",
+    "duration": 30,
+    "log_level": "INFO",
+}
 
-                await asyncio.sleep(1)  # Delay between pairs
 
-            await asyncio.sleep(5)  # Wait before next round
+def parse_arguments(argv=None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    if argv is None:
+        argv = sys.argv[1:]
 
+    # The common invocation passes no options, so skip building the parser
+    if not argv:
+        return argparse.Namespace(**DEFAULT_ARGS)
 
-async def main():
-    """Main entry point."""
     parser = argparse.ArgumentParser(
         description="FastMCP test client for Luno MCP server"
     )
     parser.add_argument(
         "--transport",
         choices=["stdio", "streamable-http", "sse"],
-        default="stdio",
+        default=DEFAULT_ARGS["transport"],
         help="Transport type to use",
     )
     parser.add_argument(
         "--host",
-        default="localhost",
+        default=DEFAULT_ARGS["host"],
         help="Host for HTTP-based transports",
     )
     parser.add_argument(
         "--port",
         type=int,
-        default=8000,
+        default=DEFAULT_ARGS["port"],
         help="Port for HTTP-based transports",
     )
     parser.add_argument(
         "--mode",
         choices=["test", "monitor"],
-        default="test",
+        default=DEFAULT_ARGS["mode"],
         help="Mode: run basic tests or monitor prices",
     )
     parser.add_argument(
         "--pairs",
-        default="XBTZAR,ETHZAR",
+        default=DEFAULT_ARGS["pairs"],
         help="Comma-separated trading pairs to monitor",
     )
     parser.add_argument(
         "--duration",
         type=int,
-        default=30,
+        default=DEFAULT_ARGS["duration"],
         help="Duration for monitoring mode (seconds)",
     )
     parser.add_argument(
         "--log-level",
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
-        default="INFO",
+        default=DEFAULT_ARGS["log_level"],
         help="Log level",
     )
 
-    args = parser.parse_args()
+    return parser.parse_args(argv)
+
+
+async def main():
+    """Main entry point."""
+    args = parse_arguments()
 
     # Set log level
     logging.getLogger().setLevel(getattr(logging, args.log_level))
@@ -330,4 +397,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    _run(main())
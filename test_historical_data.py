@@ -13,6 +13,36 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 
 from luno_mcp_server.luno_client import LunoClient
 
+try:
+    import uvloop
+
+    _run = uvloop.run
+except ImportError:  # uvloop is optional; fall back to the default event loop
+    _run = asyncio.run
+
+
+def _candle_stats(candles):
+    """Summarise candles into open, close, high, low, average and volume."""
+    # Fold every statistic in a single pass over the candles
+    high = low = None
+    close_total = volume_total = 0.0
+    for candle in candles:
+        candle_high = float(candle["high"])
+        candle_low = float(candle["low"])
+        high = candle_high if high is None else max(high, candle_high)
+        low = candle_low if low is None else min(low, candle_low)
+        close_total += float(candle["close"])
+        volume_total += float(candle["volume"])
+
+    return {
+        "open": float(candles[0]["open"]),
+        "close": float(candles[-1]["close"]),
+        "high": high,
+        "low": low,
+        "average": close_total / len(candles),
+        "volume": volume_total,
+    }
+
 
 async def test_historical_data():
     """Test the historical data functionality."""
@@ -69,13 +99,21 @@ async def test_historical_data():
             (86400, "24h"),  # 24 hours
         ]
 
-        for duration, name in timeframes:
-            try:
-                data = await client.get_candles("XBTZAR", since, duration)
+        # Timeframes are independent, so fetch them concurrently
+        results = await asyncio.gather(
+            *[
+                client.get_candles("XBTZAR", since, duration)
+                for duration, _ in timeframes
+            ],
+            return_exceptions=True,
+        )
+
+        for (duration, name), data in zip(timeframes, results):
+            if isinstance(data, Exception):
+                print(f"❌ {name} candles: Error - {data}")
+            else:
                 count = len(data.get("candles", []))
                 print(f"✅ {name} candles: {count} retrieved")
-            except Exception as e:
-                print(f"❌ {name} candles: Error - {e}")
 
         # Test 3: Test error handling
         print("\n🚫 Test 3: Error Handling")
@@ -171,25 +209,19 @@ async def simulate_mcp_tools():
         ]
 
         # Calculate statistics like the MCP tool would
-        prices = [float(candle["close"]) for candle in mock_candles]
-        highs = [float(candle["high"]) for candle in mock_candles]
-        lows = [float(candle["low"]) for candle in mock_candles]
-        volumes = [float(candle["volume"]) for candle in mock_candles]
-
-        first_candle = mock_candles[0]
-        last_candle = mock_candles[-1]
+        stats = _candle_stats(mock_candles)
 
-        open_price = float(first_candle["open"])
-        close_price = float(last_candle["close"])
+        open_price = stats["open"]
+        close_price = stats["close"]
         price_change = close_price - open_price
         price_change_percent = (price_change / open_price) * 100
 
         print(f"✅ Price analysis simulation:")
         print(f"   Open: {open_price}, Close: {close_price}")
-        print(f"   High: {max(highs)}, Low: {min(lows)}")
+        print(f"   High: {stats['high']}, Low: {stats['low']}")
         print(f"   Change: {price_change} ({price_change_percent:.2f}%)")
-        print(f"   Average: {sum(prices) / len(prices):.2f}")
-        print(f"   Total Volume: {sum(volumes)}")
+        print(f"   Average: {stats['average']:.2f}")
+        print(f"   Total Volume: {stats['volume']}")
 
     except Exception as e:
         print(f"❌ Price analysis simulation failed: {e}")
@@ -204,10 +236,10 @@ def main():
     test_helper_functions()
 
     # Test async functions
-    asyncio.run(test_historical_data())
+    _run(test_historical_data())
 
     # Test tool simulations
-    asyncio.run(simulate_mcp_tools())
+    _run(simulate_mcp_tools())
 
     print("\n" + "=" * 50)
     print("✅ All tests completed!")
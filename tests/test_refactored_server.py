@@ -4,15 +4,37 @@ Tests for the refactored Luno MCP server.
 
 import pytest
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import patch
 from fastmcp import Client
 
 from luno_mcp.server import create_server
 from luno_mcp.config import LunoMCPConfig, TransportType, LogLevel
-from luno_mcp.client import LunoClient, LunoAPIError, LunoAuthenticationError
-
-
-@pytest.fixture
+from luno_mcp.client import LunoAPIError, LunoAuthenticationError
+
+MARKET_TOOLS = (
+    "get_crypto_price",
+    "get_market_overview",
+    "get_orderbook",
+    "get_recent_trades",
+    "get_all_tickers",
+)
+TRADING_TOOLS = (
+    "place_order",
+    "cancel_order",
+    "get_order_status",
+    "get_open_orders",
+    "get_fees",
+)
+ACCOUNT_TOOLS = (
+    "get_account_balance",
+    "get_accounts",
+    "get_transaction_history",
+    "get_pending_transactions",
+    "check_api_health",
+)
+
+
+@pytest.fixture(scope="session")
 def test_config():
     """Create a test configuration."""
     return LunoMCPConfig(
@@ -24,7 +46,7 @@ def test_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_config_no_auth():
     """Create a test configuration without authentication."""
     return LunoMCPConfig(
@@ -34,45 +56,109 @@ def test_config_no_auth():
     )
 
 
+class _StubLunoClient:
+    """Lightweight stand-in for LunoClient that returns canned responses."""
+
+    def __init__(self):
+        # Public endpoint responses
+        self.ticker = {
+            "ask": "50000.00",
+            "bid": "49900.00",
+            "last_trade": "49950.00",
+            "rolling_24_hour_volume": "100.50",
+            "timestamp": 1640995200,
+        }
+        # Raised by get_ticker instead of returning the ticker when set
+        self.ticker_error = None
+
+        self.tickers = {
+            "tickers": [
+                {"pair": "XBTZAR", "ask": "50000.00", "bid": "49900.00"},
+                {"pair": "ETHZAR", "ask": "4000.00", "bid": "3990.00"},
+            ]
+        }
+
+        self.market_summary = {
+            "markets": [
+                {"market_id": "XBTZAR", "trading_status": "ACTIVE"},
+                {"market_id": "ETHZAR", "trading_status": "ACTIVE"},
+            ]
+        }
+
+        # Private endpoint responses
+        self.balances = {
+            "balance": [
+                {"account_id": "123", "asset": "ZAR", "balance": "10000.00"},
+                {"account_id": "124", "asset": "XBT", "balance": "0.5"},
+            ]
+        }
+
+    async def get_ticker(self, pair):
+        if self.ticker_error is not None:
+            raise self.ticker_error
+        return self.ticker
+
+    async def get_tickers(self):
+        return self.tickers
+
+    async def get_market_summary(self):
+        return self.market_summary
+
+    async def get_balances(self):
+        return self.balances
+
+    async def health_check(self):
+        return True
+
+
 @pytest.fixture
-async def mock_luno_client():
+def mock_luno_client():
     """Create a mock Luno client."""
-    client = AsyncMock(spec=LunoClient)
-
-    # Mock public endpoint responses
-    client.get_ticker.return_value = {
-        "ask": "50000.00",
-        "bid": "49900.00",
-        "last_trade": "49950.00",
-        "rolling_24_hour_volume": "100.50",
-        "timestamp": 1640995200,
-    }
-
-    client.get_tickers.return_value = {
-        "tickers": [
-            {"pair": "XBTZAR", "ask": "50000.00", "bid": "49900.00"},
-            {"pair": "ETHZAR", "ask": "4000.00", "bid": "3990.00"},
-        ]
-    }
-
-    client.get_market_summary.return_value = {
-        "markets": [
-            {"market_id": "XBTZAR", "trading_status": "ACTIVE"},
-            {"market_id": "ETHZAR", "trading_status": "ACTIVE"},
-        ]
-    }
-
-    # Mock private endpoint responses
-    client.get_balances.return_value = {
-        "balance": [
-            {"account_id": "123", "asset": "ZAR", "balance": "10000.00"},
-            {"account_id": "124", "asset": "XBT", "balance": "0.5"},
-        ]
-    }
-
-    client.health_check.return_value = True
-
-    return client
+    return _StubLunoClient()
+
+
+@pytest.fixture(autouse=True)
+def patch_get_client(monkeypatch, mock_luno_client):
+    """Make get_luno_client return the per-test mock client."""
+
+    async def get_mock_client():
+        return mock_luno_client
+
+    monkeypatch.setattr("luno_mcp.server.get_luno_client", get_mock_client)
+
+
+@pytest.fixture(scope="module")
+def shared_luno_client():
+    """Create the mock Luno client bound to the shared tool server."""
+    return _StubLunoClient()
+
+
+# Servers with registered tools, keyed by the ids of their config and client
+async def _server_with_tools(config, luno_client):
+    """Create a server with its tools bound to luno_client."""
+    with patch("luno_mcp.server.get_luno_client", return_value=luno_client):
+        server = create_server(config)
+        await server._setup_tools()
+
+    return server
+
+
+@pytest.fixture(scope="module")
+def tool_server(test_config, shared_luno_client):
+    """Create the server and register its tools once for the whole module."""
+    return asyncio.run(_server_with_tools(test_config, shared_luno_client))
+
+
+async def _list_tool_names(server):
+    """List the names of all tools registered on a server."""
+    async with Client(server) as client:
+        return {t.name for t in await client.list_tools()}
+
+
+@pytest.fixture(scope="module")
+def tool_names(tool_server):
+    """Names of the tools on the shared server, listed once per module."""
+    return asyncio.run(_list_tool_names(tool_server))
 
 
 class TestLunoMCPServer:
@@ -93,186 +179,87 @@ class TestLunoMCPServer:
         assert server.description is not None
 
     @pytest.mark.asyncio
-    async def test_server_resources(self, test_config):
-        """Test server resources are available."""
+    async def test_resources_bundle(self, test_config):
+        """Test that the server resources are listed and readable."""
         server = create_server(test_config)
 
         async with Client(server) as client:
-            # Test config resource
-            resources = await client.list_resources()
-            resource_uris = [r.uri for r in resources]
-
-            assert "luno://config" in resource_uris
-            assert "luno://status" in resource_uris
-            assert "luno://endpoints" in resource_uris
-
-    @pytest.mark.asyncio
-    async def test_config_resource(self, test_config):
-        """Test the config resource."""
-        with patch("luno_mcp.server.get_luno_client") as mock_get_client:
-            mock_get_client.return_value = AsyncMock()
-
-            server = create_server(test_config)
-
-            async with Client(server) as client:
-                config_data = await client.read_resource("luno://config")
-                config_content = config_data[0].text
-
-                assert "test-luno-server" in config_content
-                assert "has_credentials" in config_content
-
-    @pytest.mark.asyncio
-    async def test_market_tools_available(self, test_config, mock_luno_client):
-        """Test that market tools are registered and available."""
-        with patch("luno_mcp.server.get_luno_client", return_value=mock_luno_client):
-            server = create_server(test_config)
-
-            # Setup tools
-            if hasattr(server, "_setup_tools"):
-                await server._setup_tools()
-
-            async with Client(server) as client:
-                tools = await client.list_tools()
-                tool_names = [t.name for t in tools]
-
-                # Check market tools are available
-                assert "get_crypto_price" in tool_names
-                assert "get_market_overview" in tool_names
-                assert "get_orderbook" in tool_names
-                assert "get_recent_trades" in tool_names
-                assert "get_all_tickers" in tool_names
-
-    @pytest.mark.asyncio
-    async def test_trading_tools_available(self, test_config, mock_luno_client):
-        """Test that trading tools are registered and available."""
-        with patch("luno_mcp.server.get_luno_client", return_value=mock_luno_client):
-            server = create_server(test_config)
-
-            # Setup tools
-            if hasattr(server, "_setup_tools"):
-                await server._setup_tools()
-
-            async with Client(server) as client:
-                tools = await client.list_tools()
-                tool_names = [t.name for t in tools]
-
-                # Check trading tools are available
-                assert "place_order" in tool_names
-                assert "cancel_order" in tool_names
-                assert "get_order_status" in tool_names
-                assert "get_open_orders" in tool_names
-                assert "get_fees" in tool_names
-
-    @pytest.mark.asyncio
-    async def test_account_tools_available(self, test_config, mock_luno_client):
-        """Test that account tools are registered and available."""
-        with patch("luno_mcp.server.get_luno_client", return_value=mock_luno_client):
-            server = create_server(test_config)
-
-            # Setup tools
-            if hasattr(server, "_setup_tools"):
-                await server._setup_tools()
-
-            async with Client(server) as client:
-                tools = await client.list_tools()
-                tool_names = [t.name for t in tools]
-
-                # Check account tools are available
-                assert "get_account_balance" in tool_names
-                assert "get_accounts" in tool_names
-                assert "get_transaction_history" in tool_names
-                assert "get_pending_transactions" in tool_names
-                assert "check_api_health" in tool_names
+            # The resources are independent, so read them concurrently
+            resources, config_data, status_data, endpoints_data = await asyncio.gather(
+                client.list_resources(),
+                client.read_resource("luno://config"),
+                client.read_resource("luno://status"),
+                client.read_resource("luno://endpoints"),
+            )
+
+        resource_uris = {str(r.uri) for r in resources}
+        assert {"luno://config", "luno://status", "luno://endpoints"} <= resource_uris
+
+        config_content = config_data[0].text
+        assert "test-luno-server" in config_content
+        assert "has_credentials" in config_content
+
+        status_content = status_data[0].text
+        assert "server_healthy" in status_content
+        assert "api_healthy" in status_content
+        assert "has_credentials" in status_content
+
+        endpoints_content = endpoints_data[0].text
+        assert "public_endpoints" in endpoints_content
+        assert "private_endpoints" in endpoints_content
+        assert "get_crypto_price" in endpoints_content
+        assert "get_account_balance" in endpoints_content
+
+    @pytest.mark.parametrize(
+        "expected",
+        [MARKET_TOOLS, TRADING_TOOLS, ACCOUNT_TOOLS],
+        ids=["market", "trading", "account"],
+    )
+    def test_tools_available(self, tool_names, expected):
+        """Test that each tool category is registered and available."""
+        assert set(expected) <= tool_names
 
     @pytest.mark.asyncio
-    async def test_get_crypto_price_tool(self, test_config, mock_luno_client):
+    async def test_get_crypto_price_tool(self, tool_server):
         """Test the get_crypto_price tool."""
-        with patch("luno_mcp.server.get_luno_client", return_value=mock_luno_client):
-            server = create_server(test_config)
-
-            # Setup tools
-            if hasattr(server, "_setup_tools"):
-                await server._setup_tools()
-
-            async with Client(server) as client:
-                result = await client.call_tool("get_crypto_price", {"pair": "XBTZAR"})
-                result_text = result[0].text
+        async with Client(tool_server) as client:
+            result = await client.call_tool("get_crypto_price", {"pair": "XBTZAR"})
+            result_text = result[0].text
 
-                assert "XBTZAR" in result_text
-                assert "50000.00" in result_text
-                assert "success" in result_text
+            assert "XBTZAR" in result_text
+            assert "50000.00" in result_text
+            assert "success" in result_text
 
     @pytest.mark.asyncio
     async def test_authentication_required_tools(
         self, test_config_no_auth, mock_luno_client
     ):
         """Test that tools requiring authentication handle missing credentials properly."""
-        with patch("luno_mcp.server.get_luno_client", return_value=mock_luno_client):
-            server = create_server(test_config_no_auth)
+        server = await _server_with_tools(test_config_no_auth, mock_luno_client)
 
-            # Setup tools
-            if hasattr(server, "_setup_tools"):
-                await server._setup_tools()
-
-            async with Client(server) as client:
-                result = await client.call_tool("get_account_balance", {})
-                result_text = result[0].text
+        async with Client(server) as client:
+            result = await client.call_tool("get_account_balance", {})
+            result_text = result[0].text
 
-                assert "authentication" in result_text.lower()
-                assert "error" in result_text.lower()
+            assert "authentication" in result_text.lower()
+            assert "error" in result_text.lower()
 
     @pytest.mark.asyncio
-    async def test_api_error_handling(self, test_config, mock_luno_client):
+    async def test_api_error_handling(self, tool_server, shared_luno_client):
         """Test API error handling in tools."""
         # Configure mock to raise an API error
-        mock_luno_client.get_ticker.side_effect = LunoAPIError(
-            "API Error", status_code=400
-        )
+        shared_luno_client.ticker_error = LunoAPIError("API Error", status_code=400)
 
-        with patch("luno_mcp.server.get_luno_client", return_value=mock_luno_client):
-            server = create_server(test_config)
-
-            # Setup tools
-            if hasattr(server, "_setup_tools"):
-                await server._setup_tools()
-
-            async with Client(server) as client:
+        try:
+            async with Client(tool_server) as client:
                 result = await client.call_tool("get_crypto_price", {"pair": "XBTZAR"})
                 result_text = result[0].text
 
                 assert "error" in result_text.lower()
                 assert "api error" in result_text.lower()
-
-    @pytest.mark.asyncio
-    async def test_server_status_resource(self, test_config, mock_luno_client):
-        """Test the server status resource."""
-        with patch("luno_mcp.server.get_luno_client", return_value=mock_luno_client):
-            server = create_server(test_config)
-
-            async with Client(server) as client:
-                status_data = await client.read_resource("luno://status")
-                status_content = status_data[0].text
-
-                assert "server_healthy" in status_content
-                assert "api_healthy" in status_content
-                assert "has_credentials" in status_content
-
-    @pytest.mark.asyncio
-    async def test_endpoints_resource(self, test_config):
-        """Test the endpoints resource."""
-        with patch("luno_mcp.server.get_luno_client") as mock_get_client:
-            mock_get_client.return_value = AsyncMock()
-
-            server = create_server(test_config)
-
-            async with Client(server) as client:
-                endpoints_data = await client.read_resource("luno://endpoints")
-                endpoints_content = endpoints_data[0].text
-
-                assert "public_endpoints" in endpoints_content
-                assert "private_endpoints" in endpoints_content
-                assert "get_crypto_price" in endpoints_content
-                assert "get_account_balance" in endpoints_content
+        finally:
+            # The mock is shared with other tests through the module server
+            shared_luno_client.ticker_error = None
 
 
 class TestConfigurationHandling:
@@ -294,22 +281,15 @@ class TestConfigurationHandling:
         assert config.api_secret is None
         assert config.server_name == "luno-mcp-server"
 
-    def test_config_environment_override(self):
+    def test_config_environment_override(self, monkeypatch):
         """Test configuration with environment variables."""
-        import os
-
-        # Set environment variables
-        os.environ["LUNO_MCP_SERVER_NAME"] = "test-server-env"
-        os.environ["LUNO_MCP_PORT"] = "9000"
+        # monkeypatch restores the environment after the test
+        monkeypatch.setenv("LUNO_MCP_SERVER_NAME", "test-server-env")
+        monkeypatch.setenv("LUNO_MCP_PORT", "9000")
 
-        try:
-            config = LunoMCPConfig()
-            assert config.server_name == "test-server-env"
-            assert config.port == 9000
-        finally:
-            # Clean up environment variables
-            os.environ.pop("LUNO_MCP_SERVER_NAME", None)
-            os.environ.pop("LUNO_MCP_PORT", None)
+        config = LunoMCPConfig()
+        assert config.server_name == "test-server-env"
+        assert config.port == 9000
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 Tests for the Luno MCP server using FastMCP testing framework.
 """
 
+import json
 import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock, patch
@@ -9,6 +10,18 @@ from fastmcp import Client
 
 from src.luno_mcp_server.server import mcp
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    _json_loads = json.loads
+
+
+def parse_tool_result(result):
+    """Parse the JSON text of the first content item of a tool result."""
+    return _json_loads(result[0].text)
+
 
 @pytest.fixture
 async def test_client():
@@ -23,7 +36,7 @@ async def test_server_tools_available(test_client):
     """Test that all expected tools are available."""
     tools = await test_client.list_tools()
 
-    expected_tools = [
+    expected_tools = {
         "get_crypto_price",
         "get_market_overview",
         "get_account_balance",
@@ -32,13 +45,11 @@ async def test_server_tools_available(test_client):
         "get_order_status",
         "get_transaction_history",
         "get_fees",
-    ]
+    }
 
-    available_tool_names = [tool.name for tool in tools.tools]
-
-    for expected_tool in expected_tools:
-        assert expected_tool in available_tool_names, f"Tool {expected_tool} not found"
+    available_tool_names = {tool.name for tool in tools.tools}
 
+    assert expected_tools <= available_tool_names
     assert len(available_tool_names) == 8
 
 
@@ -66,9 +77,7 @@ async def test_get_crypto_price_tool(test_client):
         assert content.type == "text"
 
         # Parse the JSON response
-        import json
-
-        response = json.loads(content.text)
+        response = parse_tool_result(result)
 
         assert response["pair"] == "XBTZAR"
         assert response["ask"] == "400000.0"
@@ -99,9 +108,7 @@ async def test_get_market_overview_tool(test_client):
         assert content.type == "text"
 
         # Parse the JSON response
-        import json
-
-        response = json.loads(content.text)
+        response = parse_tool_result(result)
 
         assert "markets" in response
         assert len(response["markets"]) == 2
@@ -142,9 +149,7 @@ async def test_get_account_balance_tool(test_client):
         assert content.type == "text"
 
         # Parse the JSON response
-        import json
-
-        response = json.loads(content.text)
+        response = parse_tool_result(result)
 
         assert "balance" in response
         assert len(response["balance"]) == 2
@@ -178,9 +183,7 @@ async def test_place_order_tool(test_client):
         assert content.type == "text"
 
         # Parse the JSON response
-        import json
-
-        response = json.loads(content.text)
+        response = parse_tool_result(result)
 
         assert response["order_id"] == "BXMC2CJ7HNB88U4"
         assert response["type"] == "BID"
@@ -210,9 +213,7 @@ async def test_cancel_order_tool(test_client):
         assert content.type == "text"
 
         # Parse the JSON response
-        import json
-
-        response = json.loads(content.text)
+        response = parse_tool_result(result)
 
         assert response["success"] is True
         assert response["order_id"] == "BXMC2CJ7HNB88U4"
@@ -246,9 +247,7 @@ async def test_get_order_status_tool(test_client):
         assert content.type == "text"
 
         # Parse the JSON response
-        import json
-
-        response = json.loads(content.text)
+        response = parse_tool_result(result)
 
         assert response["order_id"] == "BXMC2CJ7HNB88U4"
         assert response["type"] == "BID"
@@ -282,9 +281,7 @@ async def test_get_transaction_history_tool(test_client):
         assert content.type == "text"
 
         # Parse the JSON response
-        import json
-
-        response = json.loads(content.text)
+        response = parse_tool_result(result)
 
         assert response["id"] == "123"
         assert "transactions" in response
@@ -313,9 +310,7 @@ async def test_get_fees_tool(test_client):
         assert content.type == "text"
 
         # Parse the JSON response
-        import json
-
-        response = json.loads(content.text)
+        response = parse_tool_result(result)
 
         assert response["maker_fee"] == "0.001"
         assert response["taker_fee"] == "0.001"
@@ -340,9 +335,7 @@ async def test_tool_error_handling(test_client):
         assert content.type == "text"
 
         # Parse the JSON response
-        import json
-
-        response = json.loads(content.text)
+        response = parse_tool_result(result)
 
         assert "error" in response
         assert "API Error" in response["error"]
@@ -4,108 +4,307 @@ Simple validation script to check if our FastMCP configuration is correct.
 This runs basic syntax checks without requiring full FastMCP installation.
 """
 
+import argparse
 import ast
+import atexit
+import json
+import mmap
 import sys
 import os
-from pathlib import Path
+from functools import lru_cache
 
+# Literals a file must contain for its import check to pass, each with the
+# failure reported when it is absent; checked before paying for ast.parse
+_QUICK_NEEDLES = (
+    (
+        "src/luno_mcp_server/server.py",
+        (
+            (b"fastmcp", "Missing FastMCP import"),
+            (b"FastMCP", "Missing FastMCP import"),
+            (b"@mcp.tool", "Missing @mcp.tool() decorators"),
+        ),
+    ),
+    ("tests/test_server.py", ((b"Client", "Missing FastMCP Client import"),)),
+    ("test_client.py", ((b"Client", "Missing FastMCP Client import"),)),
+)
+
+# Per-file verdicts persisted between runs; bump the version whenever the
+# validators change so stale verdicts are discarded
+CACHE_FILE = ".validate_cache.json"
+CACHE_VERSION = 2
+
+
+def _discover(file_paths):
+    """Stat each of file_paths once.
+
+    Returns a dict mapping each existing path to its stat result, in
+    file_paths order; the stats feed both the cache keys and the validators.
+    """
+    discovered = {}
+    for file_path in file_paths:
+        try:
+            discovered[file_path] = os.stat(file_path)
+        except OSError:
+            continue
+    return discovered
+
+
+@lru_cache(maxsize=16)
+def _read_bytes(file_path, mtime_ns):
+    """Read a file once per mtime, caching its undecoded contents."""
+    with open(file_path, "rb") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=16)
+def _tree(file_path, mtime_ns):
+    """Parse a file once per mtime, sharing the AST between all checks."""
+    source = _read_bytes(file_path, mtime_ns).decode("utf-8")
+    return ast.parse(source, filename=file_path)
+
+
+def _quick_needles(content, file_path):
+    """Return the import failure implied by a missing literal, if any."""
+    for path_fragment, needles in _QUICK_NEEDLES:
+        if path_fragment not in str(file_path):
+            continue
+        for needle, failure in needles:
+            if needle not in content:
+                return failure
+    return None
 
-def validate_python_syntax(file_path):
-    """Validate Python syntax for a file."""
+
+def _imported_names(tree, module):
+    """Collect the names imported at module level with 'from <module> import'."""
+    names = set()
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.module == module:
+            names.update(alias.name for alias in node.names)
+    return names
+
+
+def _has_mcp_tool_decorator(tree):
+    """Check whether any module-level function is decorated with @mcp.tool()."""
+    for node in tree.body:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for decorator in node.decorator_list:
+            if (
+                isinstance(decorator, ast.Call)
+                and isinstance(decorator.func, ast.Attribute)
+                and decorator.func.attr == "tool"
+                and isinstance(decorator.func.value, ast.Name)
+                and decorator.func.value.id == "mcp"
+            ):
+                return True
+    return False
+
+
+def validate_python_syntax(file_path, out, mtime_ns=None):
+    """Validate Python syntax for a file, appending report lines to out."""
     try:
-        with open(file_path, "r") as f:
-            source = f.read()
-        ast.parse(source)
-        print(f"✅ {file_path}: Syntax valid")
+        if mtime_ns is None:
+            mtime_ns = os.stat(file_path).st_mtime_ns
+        _tree(file_path, mtime_ns)
+        out.append(f"✅ {file_path}: Syntax valid")
         return True
     except SyntaxError as e:
-        print(f"❌ {file_path}: Syntax error - {e}")
+        out.append(f"❌ {file_path}: Syntax error - {e}")
         return False
     except Exception as e:
-        print(f"❌ {file_path}: Error - {e}")
+        out.append(f"❌ {file_path}: Error - {e}")
         return False
 
 
-def validate_import_structure(file_path):
-    """Check if imports look correct."""
+def validate_import_structure(file_path, out, mtime_ns=None):
+    """Check if imports look correct, appending report lines to out."""
     try:
-        with open(file_path, "r") as f:
-            content = f.read()
+        if mtime_ns is None:
+            mtime_ns = os.stat(file_path).st_mtime_ns
+        failure = _quick_needles(_read_bytes(file_path, mtime_ns), file_path)
+        if failure:
+            out.append(f"❌ {file_path}: {failure}")
+            return False
+
+        tree = _tree(file_path, mtime_ns)
+        fastmcp_names = _imported_names(tree, "fastmcp")
 
         # Check for FastMCP specific imports
         if "src/luno_mcp_server/server.py" in str(file_path):
-            if "from fastmcp import FastMCP" not in content:
-                print(f"❌ {file_path}: Missing FastMCP import")
+            if "FastMCP" not in fastmcp_names:
+                out.append(f"❌ {file_path}: Missing FastMCP import")
                 return False
-            if "@mcp.tool()" not in content:
-                print(f"❌ {file_path}: Missing @mcp.tool() decorators")
+            if not _has_mcp_tool_decorator(tree):
+                out.append(f"❌ {file_path}: Missing @mcp.tool() decorators")
                 return False
-            print(f"✅ {file_path}: FastMCP imports and decorators found")
+            out.append(f"✅ {file_path}: FastMCP imports and decorators found")
 
         if "tests/test_server.py" in str(file_path):
-            if "from fastmcp import Client" not in content:
-                print(f"❌ {file_path}: Missing FastMCP Client import")
+            if "Client" not in fastmcp_names:
+                out.append(f"❌ {file_path}: Missing FastMCP Client import")
                 return False
-            print(f"✅ {file_path}: FastMCP Client import found")
+            out.append(f"✅ {file_path}: FastMCP Client import found")
 
         if "test_client.py" in str(file_path):
-            if "from fastmcp import Client" not in content:
-                print(f"❌ {file_path}: Missing FastMCP Client import")
+            if "Client" not in fastmcp_names:
+                out.append(f"❌ {file_path}: Missing FastMCP Client import")
                 return False
-            print(f"✅ {file_path}: FastMCP Client import found")
+            out.append(f"✅ {file_path}: FastMCP Client import found")
 
         return True
     except Exception as e:
-        print(f"❌ {file_path}: Error checking imports - {e}")
+        out.append(f"❌ {file_path}: Error checking imports - {e}")
         return False
 
 
-def validate_setup_py():
-    """Validate setup.py configuration."""
+# setup.py needles and their descriptions
+_SETUP_CHECKS = (
+    ("fastmcp>=2.0.0", "FastMCP dependency"),
+    ('python_requires=">=3.10"', "Python 3.10+ requirement"),
+    ("src.main:run_sync", "Correct entry point"),
+)
+_SETUP_NEEDLES = tuple(check for check, _ in _SETUP_CHECKS)
+
+
+@lru_cache(maxsize=8)
+def _scan_literals(path, mtime_ns, needles):
+    """Return which needles occur in a file.
+
+    Each needle is searched for separately, so overlapping needles are all
+    reported. The file is memory-mapped rather than read, so it is scanned
+    without being copied or decoded. mtime_ns is part of the cache key so
+    edits to the file are picked up.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped
+            return frozenset()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return frozenset(
+                needle for needle in needles if mm.find(needle.encode()) != -1
+            )
+
+
+def _cache_key(stat):
+    """Identify a file's current contents by its modification time and size."""
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _load_cache():
+    """Load the cached verdicts, discarding them if unreadable or outdated."""
+    try:
+        with open(CACHE_FILE, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _save_cache(entries):
+    """Write the cached verdicts back to disk, ignoring write failures."""
     try:
-        with open("setup.py", "r") as f:
-            content = f.read()
+        with open(CACHE_FILE, "w") as f:
+            json.dump({"version": CACHE_VERSION, "entries": entries}, f)
+    except OSError:
+        pass
+
+
+def _run_per_file(validator, discovered, cache=None):
+    """Run validator over each file in discovered, a path to stat mapping.
+
+    Files whose mtime and size match an entry in cache reuse its verdict.
+    Returns a (passed, report_lines) tuple per file, in discovered order.
+    """
+
+    def run(file_path, stat):
+        if cache is not None:
+            entry_name = f"{validator.__name__}:{file_path}"
+            key = _cache_key(stat)
+            entry = cache.get(entry_name)
+            # Entries missing a field (e.g. a hand-edited file) count as misses
+            if (
+                isinstance(entry, dict)
+                and entry.get("key") == key
+                and "passed" in entry
+                and "lines" in entry
+            ):
+                return entry["passed"], entry["lines"]
+
+        out = []
+        passed = validator(file_path, out, stat.st_mtime_ns)
+        if cache is not None:
+            cache[entry_name] = {"key": key, "passed": passed, "lines": out}
+        return passed, out
 
-        checks = [
-            ("fastmcp>=2.0.0", "FastMCP dependency"),
-            ('python_requires=">=3.10"', "Python 3.10+ requirement"),
-            ("src.main:run_sync", "Correct entry point"),
-        ]
+    return [run(file_path, stat) for file_path, stat in discovered.items()]
+
+
+def validate_setup_py(out):
+    """Validate setup.py configuration, appending report lines to out."""
+    try:
+        mtime_ns = os.stat("setup.py").st_mtime_ns
+        found = _scan_literals("setup.py", mtime_ns, _SETUP_NEEDLES)
 
         all_good = True
-        for check, description in checks:
-            if check in content:
-                print(f"✅ setup.py: {description} found")
+        for check, description in _SETUP_CHECKS:
+            if check in found:
+                out.append(f"✅ setup.py: {description} found")
             else:
-                print(f"❌ setup.py: {description} missing")
+                out.append(f"❌ setup.py: {description} missing")
                 all_good = False
 
         return all_good
     except Exception as e:
-        print(f"❌ setup.py: Error - {e}")
+        out.append(f"❌ setup.py: Error - {e}")
         return False
 
 
-def validate_requirements():
-    """Validate requirements.txt."""
+def validate_requirements(out):
+    """Validate requirements.txt, appending report lines to out."""
     try:
-        with open("requirements.txt", "r") as f:
-            content = f.read()
+        mtime_ns = os.stat("requirements.txt").st_mtime_ns
+        found = _scan_literals("requirements.txt", mtime_ns, ("fastmcp>=2.0.0",))
 
-        if "fastmcp>=2.0.0" in content:
-            print("✅ requirements.txt: FastMCP dependency found")
+        if "fastmcp>=2.0.0" in found:
+            out.append("✅ requirements.txt: FastMCP dependency found")
             return True
         else:
-            print("❌ requirements.txt: FastMCP dependency missing")
+            out.append("❌ requirements.txt: FastMCP dependency missing")
             return False
     except Exception as e:
-        print(f"❌ requirements.txt: Error - {e}")
+        out.append(f"❌ requirements.txt: Error - {e}")
         return False
 
 
+def _flush(out):
+    """Write the buffered report lines in one call and clear the buffer."""
+    sys.stdout.write("".join(line + "\n" for line in out))
+    out.clear()
+
+
+def parse_arguments(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Validate FastMCP configuration")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Ignore and do not update {CACHE_FILE}",
+    )
+    return parser.parse_args(argv)
+
+
 def main():
     """Run all validations."""
-    print("=== Validating FastMCP Configuration ===\n")
+    args = parse_arguments()
+    cache = None
+    if not args.no_cache:
+        cache = _load_cache()
+        atexit.register(_save_cache, cache)
+
+    out = ["=== Validating FastMCP Configuration ===\n"]
 
     all_passed = True
 
@@ -117,39 +316,51 @@ def main():
         "test_client.py",
     ]
 
+    discovered = _discover(files_to_check)
+
     # Syntax validation
-    print("1. Checking Python syntax...")
+    out.append("1. Checking Python syntax...")
+    results = dict(
+        zip(discovered, _run_per_file(validate_python_syntax, discovered, cache))
+    )
     for file_path in files_to_check:
-        if os.path.exists(file_path):
-            if not validate_python_syntax(file_path):
-                all_passed = False
-        else:
-            print(f"⚠️  {file_path}: File not found")
+        if file_path not in results:
+            out.append(f"⚠️  {file_path}: File not found")
+            continue
+        passed, lines = results[file_path]
+        out.extend(lines)
+        if not passed:
+            all_passed = False
+    _flush(out)
 
-    print("\n2. Checking import structure...")
-    for file_path in files_to_check:
-        if os.path.exists(file_path):
-            if not validate_import_structure(file_path):
-                all_passed = False
+    out.append("\n2. Checking import structure...")
+    for passed, lines in _run_per_file(validate_import_structure, discovered, cache):
+        out.extend(lines)
+        if not passed:
+            all_passed = False
+    _flush(out)
 
-    print("\n3. Checking setup.py...")
-    if not validate_setup_py():
+    out.append("\n3. Checking setup.py...")
+    if not validate_setup_py(out):
         all_passed = False
+    _flush(out)
 
-    print("\n4. Checking requirements.txt...")
-    if not validate_requirements():
+    out.append("\n4. Checking requirements.txt...")
+    if not validate_requirements(out):
         all_passed = False
+    _flush(out)
 
-    print(f"\n=== Validation Summary ===")
+    out.append(f"\n=== Validation Summary ===")
     if all_passed:
-        print("🎉 All validations passed! Configuration looks good.")
-        print("\nNext steps:")
-        print("1. Install Python 3.10+ if not available")
-        print("2. Install dependencies: pip install -r requirements.txt")
-        print("3. Run tests: python -m pytest tests/")
-        print("4. Test server: python test_client.py")
+        out.append("🎉 All validations passed! Configuration looks good.")
+        out.append("\nNext steps:")
+        out.append("1. Install Python 3.10+ if not available")
+        out.append("2. Install dependencies: pip install -r requirements.txt")
+        out.append("3. Run tests: python -m pytest tests/")
+        out.append("4. Test server: python test_client.py")
     else:
-        print("❌ Some validations failed. Please fix the issues above.")
+        out.append("❌ Some validations failed. Please fix the issues above.")
+    _flush(out)
 
     return 0 if all_passed else 1
 